@@ -38,8 +38,9 @@ import pygeogrids.grids as grids
 import numpy as np
 import pandas as pd
 import math
-from shapely.geometry import Point
-from poets.shape.shapes import Shape
+from shapely.geometry import LineString
+from shapely.prepared import prep
+from poets.shape.shapes import get_shape, contains
 from poets.image.imagefile import dateline_country
 
 
@@ -138,12 +139,40 @@ class RegularGrid(grids.BasicGrid):
 
         londim = np.arange(lonmin, 180, sp_res)
         latdim = np.arange(latmin, 90, sp_res)
-        lon, lat = np.meshgrid(londim, latdim)
 
-        shape = (lon.shape[1], lon.shape[0])
+        # flat coordinates as np.meshgrid(londim, latdim) would give them
+        lon = np.tile(londim, latdim.size)
+        lat = np.repeat(latdim, londim.size)
 
-        super(RegularGrid, self).__init__(lon.flatten(), lat.flatten(),
-                                          shape=shape, **kwargs)
+        shape = (londim.size, latdim.size)
+
+        super(RegularGrid, self).__init__(lon, lat, shape=shape, **kwargs)
+
+
+_regular_grids = {}
+
+
+def get_regular_grid(sp_res):
+    """Gets global RegularGrid of a specific spatial resolution.
+
+    The grid is only built on the first call for each spatial resolution,
+    subsequent calls return the same grid object.
+
+    Parameters
+    ----------
+    sp_res : int or float
+        Spatial resolution of the grid.
+
+    Returns
+    -------
+    grid : poets.grid.grids.RegularGrid
+        Global regular grid.
+    """
+
+    if sp_res not in _regular_grids:
+        _regular_grids[sp_res] = RegularGrid(sp_res)
+
+    return _regular_grids[sp_res]
 
 
 class ShapeGrid(grids.BasicGrid):
@@ -252,7 +281,7 @@ class ShapeGrid(grids.BasicGrid):
 
         self.country = region
 
-        self.shp = Shape(region, shapefile=shapefile)
+        self.shp = get_shape(region, shapefile)
 
         # countries that cross the international dateline (maybe more!)
         if region in ['NZ', 'RS', 'US']:
@@ -275,14 +304,16 @@ class ShapeGrid(grids.BasicGrid):
 
         lats = np.arange(latmin, latmax + sp_res, sp_res)
 
+        # lons and lats are already limited to the bounding box of the shape,
+        # outer rows and columns may still have no point within the shape
         lon_new, lat_new = _remove_blank_frame(region, lons, lats, shapefile)
 
-        lon, lat = np.meshgrid(lon_new, lat_new)
+        lon = np.tile(lon_new, len(lat_new))
+        lat = np.repeat(lat_new, len(lon_new))
 
-        shape = (lon.shape[1], lon.shape[0])
+        shape = (len(lon_new), len(lat_new))
 
-        super(ShapeGrid, self).__init__(lon.flatten(), lat.flatten(),
-                                        shape=shape)
+        super(ShapeGrid, self).__init__(lon, lat, shape=shape)
 
     def get_gridpoints(self):
         """Gets all points within a country shape.
@@ -301,18 +332,12 @@ class ShapeGrid(grids.BasicGrid):
                                         self.shp.bbox[0], self.shp.bbox[2])
         poly = self.shp.polygon  # MultiPolygon
 
-        lons = []
-        lats = []
-        pts = []
+        box = np.asarray(box)
+        lons, lats = self.gpi2lonlat(box)
+        inside = contains(poly, lons, lats)
 
-        for gpi in box:
-            lon, lat = self.gpi2lonlat(gpi)
-            if poly.contains(Point(lon, lat)):
-                    pts.append(gpi)
-                    lons.append(lon)
-                    lats.append(lat)
-
-        points = pd.DataFrame({'lon': lons, 'lat': lats}, pts)
+        points = pd.DataFrame({'lon': lons[inside], 'lat': lats[inside]},
+                              box[inside])
 
         return points
 
@@ -337,75 +362,66 @@ def _remove_blank_frame(region, lons, lats, shapefile=None):
         Updated list of latitudes.
     """
 
-    shp = Shape(region, shapefile)
+    shp = get_shape(region, shapefile)
 
     poly = shp.polygon
+    prepared = prep(poly)
 
-    del_lons = []
-    del_lats = []
-
-    # left boundary check
-    for i, x in enumerate(lons[:(lons.size / 2)]):
-        checksum = 0
-        for y in lats:
-            p = Point(x, y)
-            if not p.within(poly):
-                checksum += 1
-        if checksum == lats.size:
-            del_lons.append(i)
-        else:
-            break
-
-    # right boundary check
-    for i, x in enumerate(lons[::-1][:(lons.size / 2)]):
-        checksum = 0
-        for y in lats:
-            p = Point(x, y)
-            if not p.within(poly):
-                checksum += 1
-        if checksum == lats.size:
-            del_lons.append(lons.size - 1 - i)
-        else:
-            break
-
-    # bottom boundary check
-    for i, y in enumerate(lats[:(lats.size / 2)]):
-        checksum = 0
-        for x in lons:
-            p = Point(x, y)
-            if not p.within(poly):
-                checksum += 1
-        if checksum == lons.size:
-            del_lats.append(i)
-        else:
-            break
-
-    # top boundary check
-    for i, y in enumerate(lats[::-1][:(lats.size / 2)]):
-        checksum = 0
-        for x in lons:
-            p = Point(x, y)
-            if not p.within(poly):
-                checksum += 1
-        if checksum == lons.size:
-            del_lats.append(lats.size - 1 - i)
-        else:
-            break
+    inside = np.zeros((lats.size, lons.size), dtype=bool)
+
+    if lons.size > 0:
+        # rows that do not cross the shape have no point within it
+        rows = np.array([prepared.intersects(LineString([(lons.min(), y),
+                                                         (lons.max(), y)]))
+                         for y in lats], dtype=bool)
+
+        # test all points of the remaining rows at once
+        lon, lat = np.meshgrid(lons, lats[rows])
+        inside[rows] = contains(poly, lon, lat)
 
-    lon_new = lons.tolist()
-    lat_new = lats.tolist()
+    col_has = inside.any(axis=0)
+    row_has = inside.any(axis=1)
 
-    for i in del_lons:
-        if lons[i] in lon_new:
-            lon_new.remove(lons[i])
+    left, right = _blank_edges(col_has)
+    bottom, top = _blank_edges(row_has)
 
-    for i in del_lats:
-        if lats[i] in lat_new:
-            lat_new.remove(lats[i])
+    lon_new = lons[left:lons.size - right].tolist()
+    lat_new = lats[bottom:lats.size - top].tolist()
 
     return lon_new, lat_new
 
 
+def _blank_edges(has_points):
+    """Counts blank columns or rows at both edges of a frame.
+
+    At most half of the columns or rows are counted per edge, as the frame
+    has always been trimmed that way and changing it would change existing
+    grids.
+
+    Parameters
+    ----------
+    has_points : numpy.ndarray of bool
+        True for columns or rows with at least one point in region.
+
+    Returns
+    -------
+    first : int
+        Number of blank entries at the start.
+    last : int
+        Number of blank entries at the end.
+    """
+
+    half = has_points.size // 2
+
+    if has_points.any():
+        first = np.argmax(has_points)
+        last = np.argmax(has_points[::-1])
+    else:
+        first = last = has_points.size
+
+    return min(first, half), min(last, half)
+
+
 def _minmaxcoord(min_threshold, max_threshold, sp_res):
     """Gets min and max coordinates of a specific grid.
 
@@ -41,7 +41,7 @@ import numpy as np
 import math
 from osgeo import gdal
 from PIL import Image
-from poets.shape.shapes import Shape
+from poets.shape.shapes import get_shape
 from poets.image.geotiff import lonlat2px_gt, px2lonlat_gt
 
 
@@ -330,7 +330,7 @@ def bbox_img(source_file, region, fileExtension, shapefile=None):
         lat_min = -90
         lat_max = 90
     else:
-        shp = Shape(region, shapefile)
+        shp = get_shape(region, shapefile)
         lon_min = shp.bbox[0]
         lon_max = shp.bbox[2]
         lat_min = shp.bbox[1]
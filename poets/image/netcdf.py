@@ -80,7 +80,7 @@ def save_image(image, timestamp, region, metadata, dest_file, start_date,
     """
 
     if region == 'global':
-        grid = grids.RegularGrid(sp_res)
+        grid = grids.get_regular_grid(sp_res)
     else:
         grid = grids.ShapeGrid(region, sp_res, shapefile)
 
@@ -175,7 +175,7 @@ def write_tmp_file(image, timestamp, region, metadata, dest_file, start_date,
     """
 
     if region == 'global':
-        grid = grids.RegularGrid(sp_res)
+        grid = grids.get_regular_grid(sp_res)
     else:
         grid = grids.ShapeGrid(region, sp_res, shapefile)
 
@@ -36,11 +36,9 @@ import os
 import numpy as np
 import poets.image.netcdf as nc
 import poets.image.hdf5 as h5
-import matplotlib.path
 from poets.image.imagefile import bbox_img
-from poets.shape.shapes import Shape
+from poets.shape.shapes import get_shape, contains
 from pytesmo.grid import resample
-import scipy
 
 
 imgfiletypes = ['.png', '.PNG', '.tif', '.tiff', '.TIF', '.TIFF', '.jpg',
@@ -103,7 +101,7 @@ def resample_to_shape(source_file, region, sp_res, grid, prefix=None,
         lat_min = -90
         lat_max = 90
     else:
-        shp = Shape(region, shapefile)
+        shp = get_shape(region, shapefile)
         lon_min = shp.bbox[0]
         lon_max = shp.bbox[2]
         lat_min = shp.bbox[1]
@@ -137,8 +135,10 @@ def resample_to_shape(source_file, region, sp_res, grid, prefix=None,
 
     src_lon, src_lat = np.meshgrid(src_lon, src_lat)
 
+    # grid points are ordered row by row, grid.shape is (lon, lat)
     lons = grid.arrlon[0:grid.shape[0]]
-    dest_lon, dest_lat = np.meshgrid(lons, np.unique(grid.arrlat)[::-1])
+    lats = grid.arrlat[::grid.shape[0]]
+    dest_lon, dest_lat = np.meshgrid(lons, lats[::-1])
 
     gpis = grid.get_bbox_grid_points(grid.arrlat.min(), grid.arrlat.max(),
                                      grid.arrlon.min(), grid.arrlon.max())
@@ -149,21 +149,9 @@ def resample_to_shape(source_file, region, sp_res, grid, prefix=None,
                                      dest_lat, search_rad=search_rad)
 
     res_data = {}
-    path = []
 
     if region != 'global':
-        _, _, multipoly = shp._get_shape()
-        for ring in multipoly:
-            poly_verts = list(ring.exterior.coords)
-            path.append(matplotlib.path.Path(poly_verts))
-
-        coords = [grid.arrlon, grid.arrlat[::-1]]
-        coords2 = np.zeros((len(coords[0]), 2))
-
-        for idx in range(0, len(coords[0])):
-            coords2[idx] = [coords[0][idx], coords[1][idx]]
-
-        mask_old = path[0].contains_points(coords2)
+        inside = contains(shp.polygon, dest_lon, dest_lat)
 
     for key in data.keys():
         if variables is not None:
@@ -172,15 +160,7 @@ def resample_to_shape(source_file, region, sp_res, grid, prefix=None,
                 continue
 
         if region != 'global':
-            for ring in path:
-                mask_new = (ring.contains_points(coords2))
-                mask_rev = scipy.logical_or(mask_old, mask_new)
-                mask_old = mask_rev
-
-            mask_rev = mask_rev.reshape(dest_lon.shape)
-            mask = np.invert(mask_rev)
-
-            mask[data[key].mask == True] = True
+            mask = np.invert(inside) | np.ma.getmaskarray(data[key])
         else:
             mask = data[key].mask
 
@@ -193,13 +173,12 @@ def resample_to_shape(source_file, region, sp_res, grid, prefix=None,
             metadata[var] = metadata[key]
             if var != key:
                 del metadata[key]
-        res_data[var] = np.ma.masked_array(data[key], mask=np.copy(mask),
-                                           fill_value=dest_nan_value)
 
-        dat = np.copy(res_data[var].data)
-        dat[mask == True] = dest_nan_value
+        # resampled data is not used elsewhere, so fill it in place
+        dat = np.ma.getdata(data[key])
+        dat[mask] = dest_nan_value
 
-        res_data[var] = np.ma.masked_array(dat, mask=np.copy(mask),
+        res_data[var] = np.ma.masked_array(dat, mask=mask,
                                            fill_value=dest_nan_value)
 
     return res_data, dest_lon, dest_lat, gpis, timestamp, metadata
@@ -34,7 +34,7 @@
 
 from datetime import datetime, timedelta
 from netCDF4 import Dataset, num2date, date2num
-from poets.grid.grids import ShapeGrid, RegularGrid
+from poets.grid.grids import ShapeGrid, get_regular_grid
 from poets.image.resampling import resample_to_shape, average_layers
 from poets.io.download import download_http, download_ftp, download_sftp, \
     get_file_date, download_local
@@ -430,7 +430,7 @@ class BasicSource(object):
         dirList.sort()
 
         if region == 'global':
-            grid = gr.RegularGrid(sp_res=self.dest_sp_res)
+            grid = gr.get_regular_grid(self.dest_sp_res)
         else:
             grid = gr.ShapeGrid(region, self.dest_sp_res, shapefile)
 
@@ -815,7 +815,7 @@ class BasicSource(object):
 
         if type(location) is tuple:
             if region == 'global':
-                grid = RegularGrid(self.dest_sp_res)
+                grid = get_regular_grid(self.dest_sp_res)
             else:
                 grid = ShapeGrid(region, self.dest_sp_res, shapefile)
 
@@ -899,7 +899,7 @@ class BasicSource(object):
         if type(locations[0]) is tuple:
             if grid is None:
                 if region == 'global':
-                    grid = RegularGrid(self.dest_sp_res)
+                    grid = get_regular_grid(self.dest_sp_res)
                 else:
                     grid = ShapeGrid(region, self.dest_sp_res, shapefile)
 
@@ -917,20 +917,19 @@ class BasicSource(object):
         var_dates = self._check_current_date()
 
         df_list = {}
-        lat_pos = []
-        lon_pos = []
+        lat_pos = np.empty(len(gpis), dtype=int)
+        lon_pos = np.empty(len(gpis), dtype=int)
 
         with Dataset(source_file, 'r', format='NETCDF4') as nc:
 
             time = nc.variables['time']
             dates = num2date(time[:], units=time.units, calendar=time.calendar)
 
-            for gp in gpis:
-                position = np.where(nc.variables['gpi'][:] == gp)
-                lat_pos = np.append(lat_pos, int(position[0][0]))
-                lon_pos = np.append(lon_pos, int(position[1][0]))
-            lat_pos = map(int, lat_pos)
-            lon_pos = map(int, lon_pos)
+            nc_gpis = nc.variables['gpi'][:]
+            for idx, gp in enumerate(gpis):
+                position = np.where(nc_gpis == gp)
+                lat_pos[idx] = position[0][0]
+                lon_pos[idx] = position[1][0]
             df = pd.DataFrame(index=pd.DatetimeIndex(dates))
 
             for ncv in variable:
@@ -33,9 +33,15 @@
 # Creation date: 2014-06-04
 
 import os
+import numpy as np
 import shapefile
 from shapely.geometry import MultiPolygon, mapping
 
+try:
+    from shapely import vectorized
+except ImportError:
+    vectorized = None
+
 
 class FipsError(Exception):
     pass
@@ -134,3 +140,106 @@ class Shape(object):
         multipoly = MultiPolygon(multipoly)
 
         return sh.record, sh.shape.bbox, multipoly
+
+
+_shapes = {}
+
+
+def get_shape(code, shapefile=None):
+    """Gets Shape of a region.
+
+    The shapefile is only read on the first call for each code and
+    shapefile, subsequent calls return the same Shape object.
+
+    Parameters
+    ----------
+    code : str
+        Identifier of the records in the shapefile, for the default shapefile,
+        this would be the FIPS country code.
+    shapefile : str, optional
+        Path to shape file, uses "world country admin boundary shapefile" by
+        default.
+
+    Returns
+    -------
+    shp : poets.shape.shapes.Shape
+        Shape of the region.
+    """
+
+    if (code, shapefile) not in _shapes:
+        _shapes[(code, shapefile)] = Shape(code, shapefile)
+
+    return _shapes[(code, shapefile)]
+
+
+def contains(polygon, lon, lat):
+    """Tests which points are located within a polygon.
+
+    Uses shapely.vectorized if available (Shapely >= 1.4), otherwise falls
+    back to a crossing number test on the polygon vertices.
+
+    Parameters
+    ----------
+    polygon : shapely.geometry.Polygon or shapely.geometry.MultiPolygon
+        Polygon to test the points against.
+    lon : numpy.ndarray
+        Longitudes of the points.
+    lat : numpy.ndarray
+        Latitudes of the points, same shape as lon.
+
+    Returns
+    -------
+    inside : numpy.ndarray of bool
+        True for points within the polygon, same shape as lon.
+    """
+
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+
+    if vectorized is not None:
+        return vectorized.contains(polygon, lon, lat)
+
+    return _crossing_number(polygon, lon, lat)
+
+
+def _crossing_number(polygon, lon, lat):
+    """Point in polygon test based on the crossing number of the points.
+
+    Counts how many polygon edges a ray from each point in positive
+    longitude direction crosses; points with an odd count are within the
+    polygon. The count runs over the rings of all parts, so parts lying
+    within another part (e.g. Lesotho in South Africa) are holes, as in
+    shapely.vectorized. The loop runs over the polygon edges, each edge is
+    tested against all points at once.
+
+    Parameters
+    ----------
+    polygon : shapely.geometry.Polygon or shapely.geometry.MultiPolygon
+        Polygon to test the points against.
+    lon : numpy.ndarray
+        Longitudes of the points.
+    lat : numpy.ndarray
+        Latitudes of the points, same shape as lon.
+
+    Returns
+    -------
+    inside : numpy.ndarray of bool
+        True for points within the polygon, same shape as lon.
+    """
+
+    inside = np.zeros(lon.shape, dtype=bool)
+
+    for poly in getattr(polygon, 'geoms', [polygon]):
+        for ring in [poly.exterior] + list(poly.interiors):
+            verts = np.asarray(ring.coords)
+            vx = verts[:, 0]
+            vy = verts[:, 1]
+            for i in range(len(verts) - 1):
+                if vy[i] == vy[i + 1]:
+                    continue
+                x_cross = (vx[i] + (lat - vy[i]) * (vx[i + 1] - vx[i]) /
+                           (vy[i + 1] - vy[i]))
+                inside ^= (((vy[i] > lat) != (vy[i + 1] > lat)) &
+                           (lon < x_cross))
+
+    return inside
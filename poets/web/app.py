@@ -42,7 +42,7 @@ import numpy as np
 import pandas as pd
 from poets.timedate.dateindex import get_dtindex
 from poets.web.overlays import image_bounds
-from poets.shape.shapes import Shape
+from poets.shape.shapes import get_shape
 from pytesmo.time_series.anomaly import calc_anomaly, calc_climatology
 import urlparse
 import matplotlib as mpl
@@ -630,7 +630,7 @@ def get_geojson(region):
     coordinates : list
     """
 
-    shape = Shape(region, p.shapefile).polygon
+    shape = get_shape(region, p.shapefile).polygon
 
     return jsonify(mapping(shape))
 
@@ -36,7 +36,7 @@
 This modules provides functions used while creating image overlays.
 """
 
-from poets.shape.shapes import Shape
+from poets.shape.shapes import get_shape
 from poets.grid.grids import ShapeGrid
 
 
@@ -69,7 +69,7 @@ def bounds(country, shapefile=None):
     zoom : int
         Zoom level for openlayers.
     """
-    shp = Shape(country, shapefile)
+    shp = get_shape(country, shapefile)
 
     lon_min = shp.bbox[0]
     lon_max = shp.bbox[2]
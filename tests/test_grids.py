@@ -33,7 +33,10 @@
 # Creation date: 2014-07-07
 
 import unittest
-from poets.grid.grids import ShapeGrid, RegularGrid
+import numpy as np
+import numpy.testing as nptest
+from poets.grid.grids import ShapeGrid, RegularGrid, get_regular_grid, \
+    _remove_blank_frame, _minmaxcoord
 
 
 class Test(unittest.TestCase):
@@ -79,6 +82,68 @@ class Test(unittest.TestCase):
         assert grid_bbox == bbox
         assert grid.shape == grid_shape
 
+    def test_get_regular_grid(self):
+        grid = get_regular_grid(self.sp_res1)
+
+        # same object for the same spatial resolution only
+        assert get_regular_grid(self.sp_res1) is grid
+        assert get_regular_grid(self.sp_res) is not grid
+
+        regular = RegularGrid(sp_res=self.sp_res1)
+
+        nptest.assert_array_equal(grid.arrlon, regular.arrlon)
+        nptest.assert_array_equal(grid.arrlat, regular.arrlat)
+        nptest.assert_array_equal(grid.gpis, regular.gpis)
+        assert grid.shape == regular.shape
+
+    def test_remove_blank_frame(self):
+        lons = np.arange(9.625, 17.126, self.sp_res)
+        lats = np.arange(46.625, 48.876, self.sp_res)
+
+        lon_new, lat_new = _remove_blank_frame(self.region, lons, lats)
+
+        # outermost columns have no point in Austria, all rows do
+        assert lon_new == lons[1:-1].tolist()
+        assert lat_new == lats.tolist()
+
+    def test_remove_blank_frame_no_points(self):
+        # single point frame, used to fail on the float slice index
+        lon_new, lat_new = _remove_blank_frame(self.region, np.array([13.375]),
+                                               np.array([47.625]))
+        assert (lon_new, lat_new) == ([13.375], [47.625])
+
+        # frames without points in the region lose half of each side
+        lons = np.arange(0.125, 1.25, self.sp_res)
+        lats = np.arange(0.125, 0.75, self.sp_res)
+        lon_new, lat_new = _remove_blank_frame(self.region, lons, lats)
+        assert (lon_new, lat_new) == ([0.625], [0.375])
+
+        lon_new, lat_new = _remove_blank_frame(self.region, np.array([]),
+                                               lats)
+        assert (lon_new, lat_new) == ([], [0.375])
+
+    def test_remove_blank_frame_half_limit(self):
+        # frame of Chile reaches to Easter Island, at most half of the
+        # columns are removed from the left side
+        lons = np.arange(-108.5, -66, 1)
+        lats = np.arange(-55.5, -18, 1)
+
+        lon_new, lat_new = _remove_blank_frame('CI', lons, lats)
+
+        assert lon_new == lons[21:-1].tolist()
+        assert lat_new == lats[1:].tolist()
+
+    def test_minmaxcoord(self):
+        # pixel centers within the thresholds
+        assert _minmaxcoord(9.53, 17.17, self.sp_res) == (9.625, 17.125)
+        assert _minmaxcoord(46.41, 49.02, self.sp_res) == (46.625, 48.875)
+
+        # thresholds between two grid lines give the pixel center
+        assert _minmaxcoord(29.57, 35.0, 60) == (30.0, 30.0)
+
+        # thresholds enclosing exactly one grid line keep that line
+        assert _minmaxcoord(-1.48, 4.2, 60) == (0.0, 0.0)
+
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
     unittest.main()
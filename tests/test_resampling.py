@@ -43,6 +43,7 @@ import matplotlib.pyplot as plt
 from datetime import datetime
 from poets.image.netcdf import save_image
 from poets.image.resampling import resample_to_shape, average_layers
+from poets.shape.shapes import get_shape, contains
 
 
 def curpath():
@@ -112,6 +113,15 @@ class Test(unittest.TestCase):
                 for key in attributes:
                     dataset.attrs[key] = attributes[key]
 
+        # Build global 1 degree HDF5 testfile
+        self.h5file_1deg = os.path.join(curpath(), 'data', 'tests_1deg.h5')
+        if os.path.exists(self.h5file_1deg):
+            os.remove(self.h5file_1deg)
+
+        with h5py.File(self.h5file_1deg, 'w') as hdf5_file:
+            group = hdf5_file.create_group('group')
+            group.create_dataset('data', data=np.ones((180, 360)))
+
         # Build png Testfile
         self.pngfile = os.path.join(curpath(), 'data', 'test_png.png')
         if os.path.exists(self.pngfile):
@@ -133,6 +143,9 @@ class Test(unittest.TestCase):
         if os.path.exists(self.pngfile):
             os.remove(self.pngfile)
 
+        if os.path.exists(self.h5file_1deg):
+            os.remove(self.h5file_1deg)
+
     def test_resample_to_shape(self):
 
         # Test global with png
@@ -184,6 +197,23 @@ class Test(unittest.TestCase):
         assert timediff.days == 0
         assert metadata == {'data': self.metadata['data']}
 
+        # Test region mask, Lesotho is not part of South Africa
+        data, dest_lon, dest_lat, _, _, _ = \
+            resample_to_shape(self.h5file_1deg, 'SF', 1, gr.ShapeGrid('SF', 1),
+                              nan_value=self.fill_value,
+                              dest_nan_value=self.fill_value)
+
+        inside = contains(get_shape('SF').polygon, dest_lon, dest_lat)
+        nptest.assert_array_equal(data['data'].mask, ~inside)
+
+        lesotho = (dest_lon == 28.5) & (dest_lat == -29.5)
+        southafrica = (dest_lon == 24.5) & (dest_lat == -30.5)
+        nptest.assert_array_equal(data['data'].mask[lesotho], [True])
+        nptest.assert_array_equal(data['data'].data[lesotho],
+                                  [self.fill_value])
+        nptest.assert_array_equal(data['data'].mask[southafrica], [False])
+        nptest.assert_array_equal(data['data'].data[southafrica], [1])
+
     def test_average_layers(self):
 
         avgimg = self.image['data'] * 2
@@ -34,7 +34,11 @@
 
 import os
 import unittest
-from poets.shape.shapes import Shape, FipsError
+import numpy as np
+import numpy.testing as nptest
+import poets.shape.shapes as shapes
+from poets.shape.shapes import Shape, FipsError, get_shape, contains, \
+    _crossing_number
 
 
 def curpath():
@@ -73,6 +77,44 @@ class Test(unittest.TestCase):
         # test if error is raised
         self.assertRaises(FipsError, Shape, 'XYZ')
 
+    def test_get_shape(self):
+        shp = get_shape(self.region)
+
+        # same object for the same code and shapefile
+        assert get_shape(self.region) is shp
+        assert shp.name == self.name
+
+        cshp = get_shape('NOE', self.shapefile)
+        assert get_shape('NOE', self.shapefile) is cshp
+        assert cshp is not shp
+
+        # shapefile is part of the key, even if it is the default one
+        dshp = get_shape(self.region, shp.shpfile)
+        assert dshp is not shp
+        assert dshp.bbox == shp.bbox
+
+        # errors are raised every time and not cached
+        self.assertRaises(FipsError, get_shape, 'XYZ')
+        self.assertRaises(FipsError, get_shape, 'XYZ')
+        assert ('XYZ', None) not in shapes._shapes
+
+    def test_crossing_number(self):
+        # fallback has to give the same points as shapely.vectorized, SF
+        # contains Lesotho as overlapping part
+        for region in [self.region, 'SF']:
+            shp = Shape(region)
+            lons = np.arange(np.floor(shp.bbox[0]) + 0.05, shp.bbox[2], 0.1)
+            lats = np.arange(np.floor(shp.bbox[1]) + 0.05, shp.bbox[3], 0.1)
+            lon, lat = np.meshgrid(lons, lats)
+
+            nptest.assert_array_equal(_crossing_number(shp.polygon, lon, lat),
+                                      contains(shp.polygon, lon, lat))
+
+        # points in Lesotho and South Africa
+        inside = _crossing_number(Shape('SF').polygon, np.array([28.5, 24.5]),
+                                  np.array([-29.5, -30.5]))
+        nptest.assert_array_equal(inside, [False, True])
+
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
     unittest.main()